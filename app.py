@@ -1,17 +1,24 @@
 """Shiny Pokemon Hunter - Streamlit App for Pokemon Legends: Z-A and Scarlet/Violet."""
 
+import logging
+import os
 import streamlit as st
+from streamlit import column_config
 import pandas as pd
-import time
+from html import escape
 from database import (
     init_db, add_shiny, get_all_shinies, get_shiny_count,
-    update_hunt_progress, get_hunt_progress, get_hunt_stats, reset_hunt, delete_shiny
+    update_hunt_progress, get_hunt_progress, reset_hunt, delete_shinies,
+    get_stats_bundle, get_data_version
 )
 from pokeapi import (
-    get_za_pokemon, get_pokemon_data, get_pokemon_sprite,
-    get_types, HUNT_METHODS, get_recommended_method
+    get_za_pokemon, get_pokemon_sprite, prefetch_sprites,
+    get_sprite_atlas, get_pokemon_by_type, get_types, HUNT_METHODS, get_recommended_method
 )
 
+# PokeAPI errors are logged as warnings; show them on stderr with the module name
+logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(name)s %(levelname)s: %(message)s")
+
 # Page config
 st.set_page_config(
     page_title="Shiny Pokemon Hunter",
@@ -20,74 +27,115 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for dark mode
-st.markdown("""
-<style>
-    /* Dark mode adjustments */
-    .stApp {
-        background-color: #0e1117;
-    }
-    
-    /* Pokemon card styling */
-    .pokemon-card {
-        background-color: #1e1e2e;
-        border-radius: 12px;
-        padding: 15px;
-        text-align: center;
-        transition: transform 0.2s;
-    }
-    .pokemon-card:hover {
-        transform: scale(1.05);
-    }
-    
-    /* Shiny badge */
-    .shiny-badge {
-        background: linear-gradient(45deg, #FFD700, #FFA500);
-        color: #000;
-        padding: 4px 12px;
-        border-radius: 20px;
-        font-weight: bold;
-        font-size: 12px;
-    }
-    
-    /* Hunt method badges */
-    .method-badge {
-        background-color: #2d2d44;
-        padding: 4px 8px;
-        border-radius: 6px;
-        font-size: 11px;
-    }
-    
-    /* Stats cards */
-    .stat-card {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-        border-radius: 12px;
-        padding: 20px;
-        text-align: center;
-    }
-    .stat-number {
-        font-size: 36px;
-        font-weight: bold;
-        color: #FFD700;
-    }
-    .stat-label {
-        font-size: 14px;
-        color: #aaa;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Cards rendered per page of the Pokedex and shinies grids
+POKEDEX_PAGE_SIZE = 60
+SHINIES_PAGE_SIZE = 40
+
+# Recent search queries whose filtered name lists are kept per session
+NAME_FILTER_CACHE_SIZE = 16
+
+# Hunt method selectbox options
+HUNT_METHOD_KEYS = list(HUNT_METHODS.keys())
+SHINY_METHOD_OPTIONS = ["Unknown"] + HUNT_METHOD_KEYS
+
+# Custom CSS (dark theme colors are set in .streamlit/config.toml)
+@st.cache_data(show_spinner=False)
+def load_css():
+    """Read the app stylesheet once per process."""
+    with open(os.path.join(os.path.dirname(__file__), 'static', 'styles.css'), encoding='utf-8') as f:
+        return f.read()
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # Initialize database
 init_db()
 
 # Session state
-if 'pokemon_list' not in st.session_state:
-    with st.spinner('Loading Pokemon from Z-A Pokedex...'):
-        st.session_state.pokemon_list = get_za_pokemon()
+if not st.session_state.get('name_to_pokemon'):
+    # Lookup tables for the Pokemon selectors, built once per session from the
+    # Pokedex that get_za_pokemon() memoizes across sessions
+    pokemon_list = get_za_pokemon()
+    st.session_state.pokemon_list = pokemon_list
+    st.session_state.pokemon_names = [p.name for p in pokemon_list]
+    st.session_state.name_to_pokemon = {p.name: p for p in pokemon_list}
+    st.session_state.lower_names = [(p.name, p.name.lower()) for p in pokemon_list]
+    st.session_state.name_filter_cache = {}
 if 'show_shiny' not in st.session_state:
     st.session_state.show_shiny = False
 
+# Cached DB reads; the data version argument changes on every write, so a
+# cached result is reused until shinies or hunts are modified
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_stats_bundle(data_version):
+    """Stats page aggregates, read with one DB connection."""
+    return get_stats_bundle()
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_hunts(data_version):
+    """All hunt progress rows as dicts."""
+    return [dict(row) for row in get_hunt_progress()]
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_shinies(data_version):
+    """All caught shinies as dicts."""
+    return [dict(row) for row in get_all_shinies()]
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_shiny_count(data_version):
+    """Total number of caught shinies."""
+    return get_shiny_count()
+
+def notify(message):
+    """Queue a toast for the rerun that follows a change."""
+    st.session_state.last_action = message
+
+def _filter_names(q):
+    """Pokemon names containing a lowercase query, memoized per session for recent queries."""
+    if not q:
+        return st.session_state.pokemon_names
+    cache = st.session_state.setdefault('name_filter_cache', {})
+    if q not in cache:
+        if len(cache) >= NAME_FILTER_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest query
+            del cache[next(iter(cache))]
+        cache[q] = [n for n, ln in st.session_state.lower_names if q in ln]
+    return cache[q]
+
+def search_pokemon_names(key):
+    """Search box; returns the Pokemon names matching it."""
+    pokemon_search = st.text_input("Search Pokemon", placeholder="Type to filter...", key=f"{key}_search")
+    return _filter_names(pokemon_search.lower())
+
+def select_pokemon(names, key, label="Select Pokemon"):
+    """Pokemon selectbox over the given names; returns the selected Pokemon or None."""
+    selected_pokemon_name = st.selectbox(label, names, key=f"{key}_select")
+    return st.session_state.name_to_pokemon.get(selected_pokemon_name)
+
+def pokemon_picker(key, label="Select Pokemon"):
+    """Search box plus selectbox; returns the selected Pokemon or None."""
+    return select_pokemon(search_pokemon_names(key), key, label)
+
+def paginate(items, key, page_size, label, reset_on=None):
+    """Page number input plus a "Showing x-y" caption; returns the items on the current page."""
+    # Back to the first page whenever reset_on (e.g. the active filters) changes
+    if st.session_state.get(f"{key}_reset_on") != reset_on:
+        st.session_state[f"{key}_reset_on"] = reset_on
+        st.session_state[key] = 1
+    
+    total = len(items)
+    page_count = max(1, (total + page_size - 1) // page_size)
+    page = st.number_input("Page", min_value=1, max_value=page_count, key=key)
+    start = (page - 1) * page_size
+    page_items = items[start:start + page_size]
+    
+    st.markdown(f"**Showing {start + 1 if total else 0}-{start + len(page_items)} of {total} {label}** (page {page} of {page_count})")
+    return page_items
+
 def main():
+    # Confirm the previous action without blocking the script
+    if 'last_action' in st.session_state:
+        st.toast(st.session_state.pop('last_action'), icon="✨")
+    
     # Sidebar navigation
     st.sidebar.title("✨ Shiny Hunter")
     st.sidebar.markdown("### Pokemon Legends: Z-A")
@@ -140,103 +188,149 @@ def pokedex_page():
     pokemon_list = st.session_state.pokemon_list
     
     if search:
-        pokemon_list = [p for p in pokemon_list if search.lower() in p['name'].lower()]
+        name_to_pokemon = st.session_state.name_to_pokemon
+        pokemon_list = [name_to_pokemon[n] for n in _filter_names(search.lower())]
     
     if selected_type != "All Types":
-        # Would need to filter by type - simplified for now
-        pass
+        type_ids = {p.id for p in get_pokemon_by_type(selected_type)}
+        pokemon_list = [p for p in pokemon_list if p.id in type_ids]
+    
+    # Display in grid, one page at a time
+    pokemon_list = paginate(pokemon_list, "pokedex_page", POKEDEX_PAGE_SIZE, "Pokemon", reset_on=(search, selected_type))
+    
+    # Build the whole grid as one HTML string so it's sent as a single element
+    show_shiny = st.session_state.show_shiny
+    with st.spinner("Preparing sprite sheet..."):
+        atlas = get_sprite_atlas([p.id for p in st.session_state.pokemon_list], shiny=show_shiny)
+    
+    if atlas:
+        # One sprite sheet for the whole Pokedex; each card shows its tile
+        atlas_url, positions = atlas
+        sprites = {
+            p.id: f'<div class="sprite-tile" style="background-image: url({atlas_url}); '
+                  f'background-position: -{positions[p.id][0]}px -{positions[p.id][1]}px;"></div>'
+            for p in pokemon_list
+        }
+    else:
+        # Fall back to inline data URIs, downloading this page's sprites in parallel first
+        sprite_uris = prefetch_sprites([p.id for p in pokemon_list], shiny=show_shiny)
+        sprites = {
+            pokemon_id: f'<img src="{uri}" width="96" style="image-rendering: pixelated;">'
+            for pokemon_id, uri in sprite_uris.items()
+        }
+    
+    badge = '<br><span class="shiny-badge">✨ SHINY</span>' if show_shiny else ''
+    cards = "".join(
+        f'<div class="pokemon-card">'
+        f'{sprites[pokemon.id]}'
+        f'<br><strong>#{pokemon.id} {pokemon.name}</strong>{badge}'
+        f'</div>'
+        for pokemon in pokemon_list
+    )
+    st.markdown(
+        f'<div class="pokemon-grid" style="grid-template-columns: repeat(6, 1fr);">{cards}</div>',
+        unsafe_allow_html=True
+    )
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def build_hunt_df(data_version):
+    """Build the Active Hunts table for the given data version."""
+    rows = load_hunts(data_version)
+    return pd.DataFrame({
+        "Sprite": [get_pokemon_sprite(h['pokemon_id'], shiny=True) for h in rows],
+        "#": [h['pokemon_id'] for h in rows],
+        "Pokemon": [h['pokemon_name'] for h in rows],
+        "Method": [h['method'] for h in rows],
+        "Encounters": [h['encounter_count'] for h in rows],
+        "Time (min)": [round(h['time_spent_minutes'], 1) for h in rows],
+        "Last Updated": [h['last_updated'][:10] if h['last_updated'] else "N/A" for h in rows],
+    }).convert_dtypes(dtype_backend='pyarrow')
+
+@st.fragment
+def _new_hunt_fragment():
+    """Start New Hunt form; its widgets rerun only this fragment."""
+    with st.expander("➕ Start New Hunt", expanded=True):
+        # The search box stays outside the form so the Pokemon list filters as you type
+        names = search_pokemon_names("new_hunt")
+        
+        with st.form("new_hunt_form"):
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                selected_pokemon = select_pokemon(names, "new_hunt")
+            
+            with col2:
+                hunt_method = st.selectbox("Hunt Method", HUNT_METHOD_KEYS)
+            
+            with col3:
+                encounters = st.number_input("Starting Encounters", min_value=0, value=0)
+            
+            submitted = st.form_submit_button("Start/Update Hunt")
+        
+        if submitted and selected_pokemon:
+            update_hunt_progress(
+                selected_pokemon.id,
+                selected_pokemon.name,
+                hunt_method,
+                encounters=encounters
+            )
+            notify(f"Started hunt for {selected_pokemon.name} using {hunt_method}!")
+            st.rerun()
+
+@st.fragment
+def _quick_update_fragment(hunts):
+    """Quick Update and Reset controls; their widgets rerun only this fragment."""
+    st.markdown("### ⚡ Quick Update")
     
-    # Display in grid
-    st.markdown(f"**Showing {len(pokemon_list)} Pokemon**")
+    hunts_by_label = {f"{h['pokemon_name']} ({h['method']})": h for h in hunts}
     
-    # Create columns
-    cols = st.columns(6)
+    col1, col2 = st.columns(2)
+    with col1:
+        selected_hunt = st.selectbox("Select Hunt", list(hunts_by_label))
     
-    for i, pokemon in enumerate(pokemon_list):
-        with cols[i % 6]:
-            sprite_url = pokemon['shiny_sprite'] if st.session_state.show_shiny else pokemon['sprite']
-            
-            st.markdown(f"""
-            <div class="pokemon-card">
-                <img src="{sprite_url}" width="96" style="image-rendering: pixelated;">
-                <br>
-                <strong>#{pokemon['id']} {pokemon['name']}</strong>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            if st.session_state.show_shiny:
-                st.markdown('<span class="shiny-badge">✨ SHINY</span>', unsafe_allow_html=True)
+    with col2:
+        new_encounters = st.number_input("Add Encounters", min_value=1, value=1)
+    
+    hunt = hunts_by_label.get(selected_hunt)
+    
+    if st.button("Add Encounters") and hunt:
+        update_hunt_progress(
+            hunt['pokemon_id'],
+            hunt['pokemon_name'],
+            hunt['method'],
+            encounters=new_encounters
+        )
+        notify(f"Added {new_encounters} encounters!")
+        st.rerun()
+    
+    # Reset option
+    st.markdown("---")
+    st.subheader("🗑️ Reset Hunt")
+    if st.button("Reset Selected Hunt", type="primary") and hunt:
+        reset_hunt(hunt['pokemon_id'], hunt['method'])
+        notify(f"Reset hunt for {hunt['pokemon_name']}!")
+        st.rerun()
 
 def hunt_tracker_page():
     """Track shiny hunting progress."""
     st.title("🎯 Hunt Tracker")
     
     # Add new hunt form
-    with st.expander("➕ Start New Hunt", expanded=True):
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # Pokemon selector with search
-            pokemon_names = [p['name'] for p in st.session_state.pokemon_list]
-            
-            # Search/filter input
-            search_col, select_col = st.columns([1, 2])
-            with search_col:
-                pokemon_search = st.text_input("Search Pokemon", placeholder="Type to filter...")
-            with select_col:
-                # Filter list if search provided
-                if pokemon_search:
-                    filtered_names = [n for n in pokemon_names if pokemon_search.lower() in n.lower()]
-                else:
-                    filtered_names = pokemon_names
-                selected_pokemon_name = st.selectbox("Select Pokemon", filtered_names)
-            selected_pokemon = next((p for p in st.session_state.pokemon_list if p['name'] == selected_pokemon_name), None)
-        
-        with col2:
-            hunt_method = st.selectbox("Hunt Method", list(HUNT_METHODS.keys()))
-        
-        with col3:
-            encounters = st.number_input("Starting Encounters", min_value=0, value=0)
-        
-        if st.button("Start/Update Hunt"):
-            if selected_pokemon:
-                update_hunt_progress(
-                    selected_pokemon['id'],
-                    selected_pokemon['name'],
-                    hunt_method,
-                    encounters=encounters
-                )
-                st.success(f"Started hunt for {selected_pokemon['name']} using {hunt_method}!")
-                time.sleep(1)
-                st.rerun()
+    _new_hunt_fragment()
     
     st.markdown("---")
     
     # Current hunts
     st.subheader("📊 Active Hunts")
-    hunts = get_hunt_progress()
+    data_version = get_data_version()
+    hunts = load_hunts(data_version)
     
     if not hunts:
         st.info("No active hunts. Start one above!")
         return
     
     # Display hunts in a table with proper image rendering
-    from streamlit import column_config
-    
-    hunt_data = []
-    for hunt in hunts:
-        sprite = get_pokemon_sprite(hunt['pokemon_id'], shiny=True)
-        hunt_data.append({
-            "Sprite": sprite,
-            "#": hunt['pokemon_id'],
-            "Pokemon": hunt['pokemon_name'],
-            "Method": hunt['method'],
-            "Encounters": hunt['encounter_count'],
-            "Time (min)": round(hunt['time_spent_minutes'], 1),
-            "Last Updated": hunt['last_updated'][:10] if hunt['last_updated'] else "N/A"
-        })
-    
-    df = pd.DataFrame(hunt_data)
+    df = build_hunt_df(data_version)
     
     # Configure columns to show images properly
     st.dataframe(
@@ -248,48 +342,46 @@ def hunt_tracker_page():
         hide_index=True
     )
     
-    # Quick update section
-    st.markdown("### ⚡ Quick Update")
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        hunt_options = [f"{h['pokemon_name']} ({h['method']})" for h in hunts]
-        selected_hunt = st.selectbox("Select Hunt", hunt_options)
-    
-    with col2:
-        new_encounters = st.number_input("Add Encounters", min_value=1, value=1)
-    
-    if st.button("Add Encounters"):
-        # Find the hunt
-        for hunt in hunts:
-            if f"{hunt['pokemon_name']} ({hunt['method']})" == selected_hunt:
-                update_hunt_progress(
-                    hunt['pokemon_id'],
-                    hunt['pokemon_name'],
-                    hunt['method'],
-                    encounters=new_encounters
-                )
-                st.success(f"Added {new_encounters} encounters!")
-                time.sleep(1)
-                st.rerun()
-    
-    # Reset option
-    st.markdown("---")
-    st.subheader("🗑️ Reset Hunt")
-    if st.button("Reset Selected Hunt", type="primary"):
-        for hunt in hunts:
-            if f"{hunt['pokemon_name']} ({hunt['method']})" == selected_hunt:
-                reset_hunt(hunt['pokemon_id'], hunt['method'])
-                st.success(f"Reset hunt for {hunt['pokemon_name']}!")
-                time.sleep(1)
-                st.rerun()
+    # Quick update and reset
+    _quick_update_fragment(hunts)
+
+@st.fragment
+def _new_shiny_fragment():
+    """Record New Shiny form; its widgets rerun only this fragment."""
+    with st.expander("➕ Record New Shiny", expanded=True):
+        # The search box stays outside the form so the Pokemon list filters as you type
+        names = search_pokemon_names("new_shiny")
+        
+        with st.form("new_shiny_form"):
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                selected_pokemon = select_pokemon(names, "new_shiny")
+            
+            with col2:
+                hunt_method = st.selectbox("Hunt Method Used", SHINY_METHOD_OPTIONS)
+            
+            with col3:
+                notes = st.text_input("Notes (optional)", placeholder="e.g., In Lumiose City...")
+            
+            submitted = st.form_submit_button("Record Shiny!")
+        
+        if submitted and selected_pokemon:
+            add_shiny(
+                selected_pokemon.id,
+                selected_pokemon.name,
+                hunt_method if hunt_method != "Unknown" else None,
+                notes
+            )
+            notify(f"Recorded {selected_pokemon.name} as caught!")
+            st.rerun()
 
 def my_shinies_page():
     """Gallery of caught shiny Pokemon."""
     st.title("✨ My Shinies")
     
-    shinies = get_all_shinies()
-    shiny_count = get_shiny_count()
+    shinies = load_shinies(get_data_version())
+    shiny_count = load_shiny_count(get_data_version())
     
     # Stats header
     col1, col2 = st.columns([1, 3])
@@ -304,43 +396,7 @@ def my_shinies_page():
     st.markdown("---")
     
     # Add new shiny
-    with st.expander("➕ Record New Shiny", expanded=True):
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # Pokemon selector with search
-            pokemon_names = [p['name'] for p in st.session_state.pokemon_list]
-            
-            # Search/filter input
-            search_col, select_col = st.columns([1, 2])
-            with search_col:
-                pokemon_search = st.text_input("Search Pokemon", placeholder="Type to filter...")
-            with select_col:
-                # Filter list if search provided
-                if pokemon_search:
-                    filtered_names = [n for n in pokemon_names if pokemon_search.lower() in n.lower()]
-                else:
-                    filtered_names = pokemon_names
-                selected_pokemon_name = st.selectbox("Select Pokemon", filtered_names)
-            selected_pokemon = next((p for p in st.session_state.pokemon_list if p['name'] == selected_pokemon_name), None)
-        
-        with col2:
-            hunt_method = st.selectbox("Hunt Method Used", ["Unknown"] + list(HUNT_METHODS.keys()))
-        
-        with col3:
-            notes = st.text_input("Notes (optional)", placeholder="e.g., In Lumiose City...")
-        
-        if st.button("Record Shiny!"):
-            if selected_pokemon:
-                add_shiny(
-                    selected_pokemon['id'],
-                    selected_pokemon['name'],
-                    hunt_method if hunt_method != "Unknown" else None,
-                    notes
-                )
-                st.success(f"✨ Recorded {selected_pokemon['name']} as caught!")
-                time.sleep(1)
-                st.rerun()
+    _new_shiny_fragment()
     
     st.markdown("---")
     
@@ -351,297 +407,321 @@ def my_shinies_page():
     
     st.markdown(f"### Caught Shinies ({len(shinies)})")
     
-    # Grid display
-    cols = st.columns(4)
+    # Grid display, one page at a time, built as one HTML string so it's sent as a single element
+    page_shinies = paginate(shinies, "shinies_page", SHINIES_PAGE_SIZE, "shinies", reset_on=len(shinies))
+    sprite_uris = prefetch_sprites({s['pokemon_id'] for s in page_shinies}, shiny=True)
+    cards = []
+    for shiny in page_shinies:
+        sprite = sprite_uris[shiny['pokemon_id']]
+        card = (
+            f'<div class="pokemon-card" style="border: 2px solid #FFD700;">'
+            f'<img src="{sprite}" width="96" style="image-rendering: pixelated;">'
+            f'<br><strong>{escape(shiny["pokemon_name"])}</strong>'
+            f'<br><span style="color: #888; font-size: 11px;">{shiny["caught_date"]}</span>'
+        )
+        if shiny['hunt_method']:
+            card += f'<br><span class="method-badge">{escape(shiny["hunt_method"])}</span>'
+        if shiny['notes']:
+            card += f'<div style="color: #888; font-size: 12px; margin-top: 6px;">📝 {escape(shiny["notes"])}</div>'
+        cards.append(card + '</div>')
+    
+    st.markdown(
+        f'<div class="pokemon-grid" style="grid-template-columns: repeat(4, 1fr);">{"".join(cards)}</div>',
+        unsafe_allow_html=True
+    )
     
-    for i, shiny in enumerate(shinies):
-        with cols[i % 4]:
-            sprite = get_pokemon_sprite(shiny['pokemon_id'], shiny=True)
-            
-            st.markdown(f"""
-            <div class="pokemon-card" style="border: 2px solid #FFD700;">
-                <img src="{sprite}" width="96" style="image-rendering: pixelated;">
-                <br>
-                <strong>{shiny['pokemon_name']}</strong>
-                <br>
-                <span style="color: #888; font-size: 11px;">{shiny['caught_date']}</span>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            if shiny['hunt_method']:
-                st.markdown(f'<span class="method-badge">{shiny["hunt_method"]}</span>', unsafe_allow_html=True)
-            
-            if shiny['notes']:
-                st.caption(f"📝 {shiny['notes']}")
+    # Delete records
+    shiny_labels = {f"{s['pokemon_name']} - {s['caught_date']} (#{s['id']})": s['id'] for s in shinies}
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        shinies_to_delete = st.multiselect("Delete Shinies", list(shiny_labels))
+    with col2:
+        if st.button("🗑️ Delete") and shinies_to_delete:
+            delete_shinies([shiny_labels[label] for label in shinies_to_delete])
+            notify(f"Deleted {len(shinies_to_delete)} shiny record(s)")
+            st.rerun()
+
+# Hunt Tips page content, kept at module level so it is built once per process
+_TIPS_INTRO = """
+## Shiny Hunting in Pokemon Legends: Z-A
+
+Welcome to the ultimate guide for shiny hunting in Pokemon Legends: Z-A! This page covers
+everything you need to know about finding shiny Pokemon in Kalos.
+
+⚠️ **Important:** Breeding and the Masuda method are NOT available in Z-A!
+"""
+
+_TIPS_ODDS = """
+### Base Shiny Odds
+- **Standard encounter:** 1 in ~4096 (affected by the Poké Radar in some games)
+- **With Shiny Charm:** 1 in ~1365 (if available in Z-A)
+- **With Lure:** 1 in ~2048 (multiplier varies by game)
+
+### What Affects Shiny Rates in Z-A?
+- **Mass Outbreaks:** Increased spawn rates for certain Pokemon
+- **Tera Raids:** Different odds depending on star level
+- **Camping/Random Encounters:** Standard base odds
+- **Regional variants:** May have different odds
+"""
+
+_TIPS_METHODS = """
+### Respawn Method (Best for Z-A)
+The most reliable method in Z-A for stationary Pokemon.
+
+**How it works:**
+1. Find your target Pokemon
+2. Weaken or defeat it (don't catch)
+3. Use a method to force a respawn (fast travel, enter/exit building)
+4. Repeat until shiny
+
+**Best for:** Boss Pokemon, story Pokemon, stationary legendaries
+
+---
+
+### Fast Travel Reset
+Uses the game's fast travel system to respawn wild Pokemon.
+
+**How it works:**
+1. Find an area with your target Pokemon
+2. Save your game
+3. Fast travel to a waypoint and back
+4. Check if shiny spawned - if not, repeat
+
+**Best for:** Open area wild Pokemon, route camping
+
+---
+
+### Door Method
+Enter and exit buildings to respawn nearby Pokemon.
+
+**How it works:**
+1. Find building near Pokemon spawn
+2. Enter building, check Pokemon
+3. Exit - Pokemon will have respawned
+4. Repeat
+
+**Best for:** City areas with many buildings (Lumiose City!)
+
+---
+
+### Special Scan / Photo Spot
+In Z-A, use the camera to find rare spawns.
+
+**How it works:**
+1. Explore with camera active
+2. Look for Pokemon that react to the camera
+3. These may have increased shiny odds
+4. Great for finding version exclusives
+
+**Best for:** Finding rare spawns, photography enthusiasts
+
+---
+
+### Mass Outbreak Hunting
+When a mass outbreak occurs, shiny rates may be boosted.
+
+**How it works:**
+1. Monitor for mass outbreak notifications
+2. Travel to the outbreak location
+3. Defeat Pokemon to trigger respawns
+4. Check each spawn for shininess
+
+**Best for:** Farming specific species quickly
+"""
+
+_TIPS_KALOS = """
+### Lumiose City
+The main hub of Z-A and a prime hunting location!
+
+**Hotspots:**
+- **Prism Tower:** Rare spawns around the base
+- **Café:** Interior and exterior spawns
+- **North/South Boulevard:** Route Pokemon
+- **Alleys:** Many buildings for door method
+
+**Tips:**
+- Use the elevator to access different floors quickly
+- Door method is extremely effective here
+- Save near the Pokemon you want to hunt
+
+---
+
+### Route Tips
+- **Route 4-7:** Good variety of Kalos natives
+- **Route 8-12:** Water types near coastlines
+- **Route 13+:** Higher-level Pokemon, more variety
+- **Snowbelle City:** Ice types (when available)
+
+---
+
+### Legendary Hunting
+Legendaries in Z-A require special strategies:
+
+1. **Save before EVERY encounter**
+2. **Check if they're shiny before battling** (look at overworld sprite)
+3. **Use Ace Trainer Pokemon for safe catching**
+4. **Stock up on ultra balls and timer balls**
+5. **Have a Pokemon with False Swipe and a status move**
+"""
+
+_TIPS_TYPES = """
+### Fire Types
+- Found in volcanic areas and sunny routes
+- Look for fire breathing from chimneys in Lumiose
+- Some fire types appear at night
+
+### Water Types
+- Rivers and lakes have best variety
+- Use fishing for guaranteed encounters
+- Surfing Pokemon often spawn in unique forms
+
+### Psychic Types
+- Often appear in mysterious locations
+- Some only appear after story progress
+- Check near ancient ruins
+
+### Fairy Types
+- Kalos is home to many fairy types
+- Look near flower fields and gardens
+- Some are version-exclusive
+
+### Dragon Types
+- Rare and powerful - hunt when you see them!
+- Often found in caves or remote areas
+- Some only appear during specific weather
+"""
+
+_TIPS_EFFICIENCY = """
+### Save Time
+- **Always save before hunting** - never lose progress
+- **Use quality headphones** - shiny sparkles have unique sounds
+- **Use the bike** - faster travel = more encounters per hour
+- **Set up a hunting spot** - find a safe place to save and repeat
+
+### Reduce Fatigue
+- Take breaks every hour
+- Use the auto-save feature strategically
+- Have a "hunting party" ready with proper abilities
+- Consider using the "catch combo" equivalent if available
+
+### Track Your Progress
+- Use this app to log every hunt!
+- Note encounter counts for future reference
+- Track which methods work best for each Pokemon
+
+---
+
+### Common Mistakes to Avoid
+1. **Not saving** - Always save before starting a hunt
+2. **Catching too fast** - Check for shininess before throwing
+3. **Ignoring sounds** - Shiny Pokemon have unique cry/sound effects
+4. **Giving up too early** - Sometimes it takes thousands of encounters
+5. **Not using the right party** - Bring False Swipe and status moves
+"""
+
+_TIPS_CHECKLIST = """
+### Before You Hunt
+- [ ] Save your game
+- [ ] Prepare party (False Swipe, status moves, catching Pokemon)
+- [ ] Stock up on balls and potions
+- [ ] Find hunting spot
+
+### During the Hunt
+- [ ] Check every Pokemon for shininess
+- [ ] Listen for unique sounds
+- [ ] Watch for sparkle effects
+- [ ] Keep track of encounter count in this app!
+
+### After Catching a Shiny!
+- [ ] Celebrate! 🎉
+- [ ] Log it in this app
+- [ ] Take screenshots for memories
+- [ ] Decide: keep or trade?
+"""
+
+@st.fragment
+def _recommendation_fragment():
+    """Per-Pokemon recommendations; reruns on its own when the selection changes."""
+    st.subheader("🎯 Recommended Methods by Pokemon")
+    
+    # Select a Pokemon
+    selected_pokemon = pokemon_picker("tips", "Select Pokemon to see recommendations")
+    
+    if selected_pokemon:
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            st.image(selected_pokemon.shiny_sprite, width=120)
+            st.markdown(f"**#{selected_pokemon.id} {selected_pokemon.name}**")
+        
+        with col2:
+            st.markdown("### Recommended Methods for Z-A:")
             
-            if st.button(f"🗑️ Delete", key=f"delete_{shiny['id']}"):
-                delete_shiny(shiny['id'])
-                st.rerun()
+            methods = get_recommended_method(selected_pokemon.name, 'Z-A')
+            st.markdown("\n\n".join(
+                f"✅ **{method.replace('_', ' ').title()}**  \n{HUNT_METHODS.get(method, 'Standard hunting method')}"
+                for method in methods
+            ))
 
 def hunt_tips_page():
     """Show recommended hunting methods."""
     st.title("💡 Hunt Tips")
     
-    st.markdown("""
-    ## Shiny Hunting in Pokemon Legends: Z-A
-    
-    Welcome to the ultimate guide for shiny hunting in Pokemon Legends: Z-A! This page covers
-    everything you need to know about finding shiny Pokemon in Kalos.
-    
-    ⚠️ **Important:** Breeding and the Masuda method are NOT available in Z-A!
-    """)
+    st.markdown(_TIPS_INTRO)
     
     st.markdown("---")
     
     # Section 1: Shiny Basics
     with st.expander("🎲 Understanding Shiny Odds", expanded=True):
-        st.markdown("""
-        ### Base Shiny Odds
-        - **Standard encounter:** 1 in ~4096 (affected by the Poké Radar in some games)
-        - **With Shiny Charm:** 1 in ~1365 (if available in Z-A)
-        - **With Lure:** 1 in ~2048 (multiplier varies by game)
-        
-        ### What Affects Shiny Rates in Z-A?
-        - **Mass Outbreaks:** Increased spawn rates for certain Pokemon
-        - **Tera Raids:** Different odds depending on star level
-        - **Camping/Random Encounters:** Standard base odds
-        - **Regional variants:** May have different odds
-        """)
+        st.markdown(_TIPS_ODDS)
     
     st.markdown("---")
     
     # Section 2: Hunting Methods
     with st.expander("🏃 Hunting Methods Explained", expanded=True):
         
-        st.markdown("""
-        ### Respawn Method (Best for Z-A)
-        The most reliable method in Z-A for stationary Pokemon.
-        
-        **How it works:**
-        1. Find your target Pokemon
-        2. Weaken or defeat it (don't catch)
-        3. Use a method to force a respawn (fast travel, enter/exit building)
-        4. Repeat until shiny
-        
-        **Best for:** Boss Pokemon, story Pokemon, stationary legendaries
-        
-        ---
-        
-        ### Fast Travel Reset
-        Uses the game's fast travel system to respawn wild Pokemon.
-        
-        **How it works:**
-        1. Find an area with your target Pokemon
-        2. Save your game
-        3. Fast travel to a waypoint and back
-        4. Check if shiny spawned - if not, repeat
-        
-        **Best for:** Open area wild Pokemon, route camping
-        
-        ---
-        
-        ### Door Method
-        Enter and exit buildings to respawn nearby Pokemon.
-        
-        **How it works:**
-        1. Find building near Pokemon spawn
-        2. Enter building, check Pokemon
-        3. Exit - Pokemon will have respawned
-        4. Repeat
-        
-        **Best for:** City areas with many buildings (Lumiose City!)
-        
-        ---
-        
-        ### Special Scan / Photo Spot
-        In Z-A, use the camera to find rare spawns.
-        
-        **How it works:**
-        1. Explore with camera active
-        2. Look for Pokemon that react to the camera
-        3. These may have increased shiny odds
-        4. Great for finding version exclusives
-        
-        **Best for:** Finding rare spawns, photography enthusiasts
-        
-        ---
-        
-        ### Mass Outbreak Hunting
-        When a mass outbreak occurs, shiny rates may be boosted.
-        
-        **How it works:**
-        1. Monitor for mass outbreak notifications
-        2. Travel to the outbreak location
-        3. Defeat Pokemon to trigger respawns
-        4. Check each spawn for shininess
-        
-        **Best for:** Farming specific species quickly
-        """)
+        st.markdown(_TIPS_METHODS)
     
     st.markdown("---")
     
     # Section 3: Z-A Specific Tips
     with st.expander("🌆 Kalos-Specific Strategies", expanded=True):
-        st.markdown("""
-        ### Lumiose City
-        The main hub of Z-A and a prime hunting location!
-        
-        **Hotspots:**
-        - **Prism Tower:** Rare spawns around the base
-        - **Café:** Interior and exterior spawns
-        - **North/South Boulevard:** Route Pokemon
-        - **Alleys:** Many buildings for door method
-        
-        **Tips:**
-        - Use the elevator to access different floors quickly
-        - Door method is extremely effective here
-        - Save near the Pokemon you want to hunt
-        
-        ---
-        
-        ### Route Tips
-        - **Route 4-7:** Good variety of Kalos natives
-        - **Route 8-12:** Water types near coastlines
-        - **Route 13+:** Higher-level Pokemon, more variety
-        - **Snowbelle City:** Ice types (when available)
-        
-        ---
-        
-        ### Legendary Hunting
-        Legendaries in Z-A require special strategies:
-        
-        1. **Save before EVERY encounter**
-        2. **Check if they're shiny before battling** (look at overworld sprite)
-        3. **Use Ace Trainer Pokemon for safe catching**
-        4. **Stock up on ultra balls and timer balls**
-        5. **Have a Pokemon with False Swipe and a status move**
-        """)
+        st.markdown(_TIPS_KALOS)
     
     st.markdown("---")
     
     # Section 4: Type-Based Recommendations
     with st.expander("🔥 Type-Specific Hunting Tips", expanded=True):
-        st.markdown("""
-        ### Fire Types
-        - Found in volcanic areas and sunny routes
-        - Look for fire breathing from chimneys in Lumiose
-        - Some fire types appear at night
-        
-        ### Water Types
-        - Rivers and lakes have best variety
-        - Use fishing for guaranteed encounters
-        - Surfing Pokemon often spawn in unique forms
-        
-        ### Psychic Types
-        - Often appear in mysterious locations
-        - Some only appear after story progress
-        - Check near ancient ruins
-        
-        ### Fairy Types
-        - Kalos is home to many fairy types
-        - Look near flower fields and gardens
-        - Some are version-exclusive
-        
-        ### Dragon Types
-        - Rare and powerful - hunt when you see them!
-        - Often found in caves or remote areas
-        - Some only appear during specific weather
-        """)
+        st.markdown(_TIPS_TYPES)
     
     st.markdown("---")
     
     # Section 5: Efficiency Tips
     with st.expander("⚡ Efficiency & Quality of Life", expanded=True):
-        st.markdown("""
-        ### Save Time
-        - **Always save before hunting** - never lose progress
-        - **Use quality headphones** - shiny sparkles have unique sounds
-        - **Use the bike** - faster travel = more encounters per hour
-        - **Set up a hunting spot** - find a safe place to save and repeat
-        
-        ### Reduce Fatigue
-        - Take breaks every hour
-        - Use the auto-save feature strategically
-        - Have a "hunting party" ready with proper abilities
-        - Consider using the "catch combo" equivalent if available
-        
-        ### Track Your Progress
-        - Use this app to log every hunt!
-        - Note encounter counts for future reference
-        - Track which methods work best for each Pokemon
-        
-        ---
-        
-        ### Common Mistakes to Avoid
-        1. **Not saving** - Always save before starting a hunt
-        2. **Catching too fast** - Check for shininess before throwing
-        3. **Ignoring sounds** - Shiny Pokemon have unique cry/sound effects
-        4. **Giving up too early** - Sometimes it takes thousands of encounters
-        5. **Not using the right party** - Bring False Swipe and status moves
-        """)
+        st.markdown(_TIPS_EFFICIENCY)
     
     st.markdown("---")
     
     # Section 6: Per-Pokemon Recommendations
-    st.subheader("🎯 Recommended Methods by Pokemon")
-    
-    # Select a Pokemon
-    pokemon_names = [p['name'] for p in st.session_state.pokemon_list]
-    selected_name = st.selectbox("Select Pokemon to see recommendations", pokemon_names)
-    
-    if selected_name:
-        selected_pokemon = next((p for p in st.session_state.pokemon_list if p['name'] == selected_name), None)
-        
-        if selected_pokemon:
-            col1, col2 = st.columns([1, 2])
-            
-            with col1:
-                sprite = get_pokemon_sprite(selected_pokemon['id'], shiny=True)
-                st.image(sprite, width=120)
-                st.markdown(f"**#{selected_pokemon['id']} {selected_pokemon['name']}**")
-            
-            with col2:
-                st.markdown("### Recommended Methods for Z-A:")
-                
-                methods = get_recommended_method(selected_pokemon['name'], 'Z-A')
-                for method in methods:
-                    st.markdown(f"✅ **{method.replace('_', ' ').title()}**")
-                    st.markdown(f"   {HUNT_METHODS.get(method, 'Standard hunting method')}")
-                    st.markdown("")
+    _recommendation_fragment()
     
     st.markdown("---")
     
     # Section 7: Quick Reference
     with st.expander("📋 Quick Reference Checklist", expanded=False):
-        st.markdown("""
-        ### Before You Hunt
-        - [ ] Save your game
-        - [ ] Prepare party (False Swipe, status moves, catching Pokemon)
-        - [ ] Stock up on balls and potions
-        - [ ] Find hunting spot
-        
-        ### During the Hunt
-        - [ ] Check every Pokemon for shininess
-        - [ ] Listen for unique sounds
-        - [ ] Watch for sparkle effects
-        - [ ] Keep track of encounter count in this app!
-        
-        ### After Catching a Shiny!
-        - [ ] Celebrate! 🎉
-        - [ ] Log it in this app
-        - [ ] Take screenshots for memories
-        - [ ] Decide: keep or trade?
-        """)
+        st.markdown(_TIPS_CHECKLIST)
 
 def stats_page():
     """Show hunt statistics."""
     st.title("📊 Statistics")
     
     # Get stats
-    shiny_count = get_shiny_count()
-    hunt_stats = get_hunt_stats()
-    hunts = get_hunt_progress()
-    shinies = get_all_shinies()
+    stats = load_stats_bundle(get_data_version())
+    shiny_count = stats['total_shinies']
+    total_encounters = stats['total_encounters']
+    total_time = round(stats['total_time'], 1)
+    shinies_by_method = stats['by_method_shiny']
+    hunts_by_method = stats['by_method_hunt']
     
     # Stats cards
     col1, col2, col3, col4 = st.columns(4)
@@ -655,7 +735,6 @@ def stats_page():
         """, unsafe_allow_html=True)
     
     with col2:
-        total_encounters = hunt_stats['total_encounters'] or 0
         st.markdown(f"""
         <div class="stat-card">
             <div class="stat-number">{total_encounters:,}</div>
@@ -664,7 +743,6 @@ def stats_page():
         """, unsafe_allow_html=True)
     
     with col3:
-        total_time = round(hunt_stats['total_time'] or 0, 1)
         st.markdown(f"""
         <div class="stat-card">
             <div class="stat-number">{total_time}</div>
@@ -675,7 +753,7 @@ def stats_page():
     with col4:
         st.markdown(f"""
         <div class="stat-card">
-            <div class="stat-number">{hunt_stats['active_hunts'] or 0}</div>
+            <div class="stat-number">{stats['active_hunts']}</div>
             <div class="stat-label">Active Hunts</div>
         </div>
         """, unsafe_allow_html=True)
@@ -683,32 +761,18 @@ def stats_page():
     st.markdown("---")
     
     # Shinies by method
-    if shinies:
+    if shinies_by_method:
         st.subheader("✨ Shinies by Hunt Method")
         
-        method_counts = {}
-        for shiny in shinies:
-            method = shiny['hunt_method'] or 'Unknown'
-            method_counts[method] = method_counts.get(method, 0) + 1
-        
-        method_df = pd.DataFrame(list(method_counts.items()), columns=['Method', 'Count'])
-        method_df = method_df.sort_values('Count', ascending=False)
-        
+        method_df = pd.DataFrame(shinies_by_method, columns=['Method', 'Count'])
         st.bar_chart(method_df.set_index('Method'))
     
     # Hunt methods distribution
-    if hunts:
+    if hunts_by_method:
         st.markdown("---")
         st.subheader("🎯 Active Hunts by Method")
         
-        method_dist = {}
-        for hunt in hunts:
-            method = hunt['method']
-            method_dist[method] = method_dist.get(method, 0) + 1
-        
-        method_dist_df = pd.DataFrame(list(method_dist.items()), columns=['Method', 'Count'])
-        method_dist_df = method_dist_df.sort_values('Count', ascending=False)
-        
+        method_dist_df = pd.DataFrame(hunts_by_method, columns=['Method', 'Count'])
         st.bar_chart(method_dist_df.set_index('Method'))
     
     # Efficiency stats
@@ -2,25 +2,35 @@
 
 import sqlite3
 import os
-from datetime import datetime
+import threading
 from contextlib import contextmanager
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'data', 'shiny_hunter.db')
 
+# Local "YYYY-MM-DD HH:MM" timestamp computed by SQLite for caught_date
+CAUGHT_DATE_SQL = "strftime('%Y-%m-%d %H:%M', 'now', 'localtime')"
+
+# One autocommit connection shared by every helper (and every Streamlit session
+# thread); the lock serializes access to it. It's reentrant so helpers can be
+# called inside transaction()
+_conn = None
+_conn_lock = threading.RLock()
+
+# Bumped on every write so callers can cache reads until the data changes
+_data_version = 0
+
 def init_db():
     """Initialize the database with required tables."""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
     
     with get_db() as conn:
-        cursor = conn.cursor()
-        
         # Caught shinies table
-        cursor.execute('''
+        conn.execute(f'''
             CREATE TABLE IF NOT EXISTS caught_shinies (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 pokemon_id INTEGER NOT NULL,
                 pokemon_name TEXT NOT NULL,
-                caught_date TEXT NOT NULL,
+                caught_date TEXT NOT NULL DEFAULT ({CAUGHT_DATE_SQL}),
                 hunt_method TEXT,
                 notes TEXT,
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP
@@ -28,7 +38,7 @@ def init_db():
         ''')
         
         # Hunt sessions table
-        cursor.execute('''
+        conn.execute('''
             CREATE TABLE IF NOT EXISTS hunt_sessions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 pokemon_id INTEGER NOT NULL,
@@ -42,7 +52,7 @@ def init_db():
         ''')
         
         # Hunt progress table (current hunts)
-        cursor.execute('''
+        conn.execute('''
             CREATE TABLE IF NOT EXISTS hunt_progress (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 pokemon_id INTEGER NOT NULL,
@@ -55,50 +65,111 @@ def init_db():
             )
         ''')
         
-        conn.commit()
+        # Indexes for the list queries' ORDER BY (UNIQUE above covers hunt lookups)
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_shinies_date ON caught_shinies(caught_date DESC)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_progress_updated ON hunt_progress(last_updated DESC)')
+
+def get_conn():
+    """Get the shared database connection, opening it on first use."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+        conn.execute('PRAGMA optimize')
+        _conn = conn
+    return _conn
 
 @contextmanager
 def get_db():
     """Get database connection."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    try:
+    with _conn_lock:
+        conn = get_conn()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+
+@contextmanager
+def transaction():
+    """Run several statements as one transaction (a single commit); nested uses join the outer one."""
+    with get_db() as conn:
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute('BEGIN')
         yield conn
-    finally:
-        conn.close()
+        conn.execute('COMMIT')
+
+def get_data_version():
+    """Get a counter that changes whenever shinies or hunts are modified."""
+    return _data_version
+
+def _bump_data_version():
+    """Mark cached reads as stale; call while holding the connection lock."""
+    global _data_version
+    _data_version += 1
 
 # Shinies operations
 def add_shiny(pokemon_id, pokemon_name, hunt_method=None, notes=None):
     """Record a caught shiny."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
+        cursor = conn.execute(f'''
             INSERT INTO caught_shinies (pokemon_id, pokemon_name, hunt_method, notes, caught_date)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (pokemon_id, pokemon_name, hunt_method, notes, datetime.now().strftime('%Y-%m-%d %H:%M')))
-        conn.commit()
+            VALUES (?, ?, ?, ?, {CAUGHT_DATE_SQL})
+        ''', (pokemon_id, pokemon_name, hunt_method, notes))
+        _bump_data_version()
         return cursor.lastrowid
 
+def add_shinies_bulk(shinies):
+    """Record many caught shinies, given as (pokemon_id, pokemon_name, hunt_method, notes) tuples."""
+    with transaction() as conn:
+        cursor = conn.executemany(f'''
+            INSERT INTO caught_shinies (pokemon_id, pokemon_name, hunt_method, notes, caught_date)
+            VALUES (?, ?, ?, ?, {CAUGHT_DATE_SQL})
+        ''', shinies)
+        _bump_data_version()
+        return cursor.rowcount
+
 def get_all_shinies():
     """Get all caught shinies."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM caught_shinies ORDER BY caught_date DESC')
+        cursor = conn.execute('''
+            SELECT id, pokemon_id, pokemon_name, caught_date, hunt_method, notes
+            FROM caught_shinies
+            ORDER BY caught_date DESC
+        ''')
         return cursor.fetchall()
 
 def get_shiny_count():
     """Get total shiny count."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) as count FROM caught_shinies')
+        cursor = conn.execute('SELECT COUNT(*) as count FROM caught_shinies')
         return cursor.fetchone()['count']
 
+# Per-method aggregates for the stats page
+SHINIES_BY_METHOD_SQL = '''
+    SELECT COALESCE(hunt_method, 'Unknown') as method, COUNT(*) as count
+    FROM caught_shinies
+    GROUP BY 1
+    ORDER BY count DESC
+'''
+HUNTS_BY_METHOD_SQL = '''
+    SELECT method, COUNT(*) as count
+    FROM hunt_progress
+    GROUP BY method
+    ORDER BY count DESC
+'''
+
 # Hunt progress operations
 def update_hunt_progress(pokemon_id, pokemon_name, method, encounters=1, time_spent=0):
     """Update hunt progress for a Pokemon."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
+        conn.execute('''
             INSERT INTO hunt_progress (pokemon_id, pokemon_name, method, encounter_count, time_spent_minutes, last_updated)
             VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
             ON CONFLICT(pokemon_id, method) DO UPDATE SET
@@ -106,20 +177,22 @@ def update_hunt_progress(pokemon_id, pokemon_name, method, encounters=1, time_sp
                 time_spent_minutes = time_spent_minutes + excluded.time_spent_minutes,
                 last_updated = CURRENT_TIMESTAMP
         ''', (pokemon_id, pokemon_name, method, encounters, time_spent))
-        conn.commit()
+        _bump_data_version()
 
 def get_hunt_progress():
     """Get all hunt progress records."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM hunt_progress ORDER BY last_updated DESC')
+        cursor = conn.execute('''
+            SELECT pokemon_id, pokemon_name, method, encounter_count, time_spent_minutes, last_updated
+            FROM hunt_progress
+            ORDER BY last_updated DESC
+        ''')
         return cursor.fetchall()
 
 def get_hunt_stats():
     """Get hunt statistics."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
+        cursor = conn.execute('''
             SELECT 
                 SUM(encounter_count) as total_encounters,
                 SUM(time_spent_minutes) as total_time,
@@ -128,19 +201,51 @@ def get_hunt_stats():
         ''')
         return cursor.fetchone()
 
+def get_shinies_by_method():
+    """Get (method, count) pairs for caught shinies, most common first."""
+    with get_db() as conn:
+        cursor = conn.execute(SHINIES_BY_METHOD_SQL)
+        return [tuple(row) for row in cursor.fetchall()]
+
+def get_hunts_by_method():
+    """Get (method, count) pairs for active hunts, most common first."""
+    with get_db() as conn:
+        cursor = conn.execute(HUNTS_BY_METHOD_SQL)
+        return [tuple(row) for row in cursor.fetchall()]
+
+def get_stats_bundle():
+    """Get every stats page aggregate using a single connection."""
+    with get_db() as conn:
+        totals = conn.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM caught_shinies) as total_shinies,
+                COALESCE(SUM(encounter_count), 0) as total_encounters,
+                COALESCE(SUM(time_spent_minutes), 0) as total_time,
+                COUNT(*) as active_hunts
+            FROM hunt_progress
+        ''').fetchone()
+        bundle = dict(totals)
+        bundle['by_method_shiny'] = [tuple(row) for row in conn.execute(SHINIES_BY_METHOD_SQL).fetchall()]
+        bundle['by_method_hunt'] = [tuple(row) for row in conn.execute(HUNTS_BY_METHOD_SQL).fetchall()]
+        return bundle
+
 def reset_hunt(pokemon_id, method):
     """Reset hunt progress for a Pokemon."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM hunt_progress WHERE pokemon_id = ? AND method = ?', (pokemon_id, method))
-        conn.commit()
+        conn.execute('DELETE FROM hunt_progress WHERE pokemon_id = ? AND method = ?', (pokemon_id, method))
+        _bump_data_version()
 
 def delete_shiny(shiny_id):
     """Delete a shiny record."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM caught_shinies WHERE id = ?', (shiny_id,))
-        conn.commit()
+        conn.execute('DELETE FROM caught_shinies WHERE id = ?', (shiny_id,))
+        _bump_data_version()
+
+def delete_shinies(shiny_ids):
+    """Delete several shiny records in one transaction."""
+    with transaction() as conn:
+        conn.executemany('DELETE FROM caught_shinies WHERE id = ?', [(shiny_id,) for shiny_id in shiny_ids])
+        _bump_data_version()
 
 if __name__ == '__main__':
     init_db()
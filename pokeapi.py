@@ -1,188 +1,467 @@
 """PokeAPI integration for Pokemon data."""
 
+import asyncio
+import base64
+import io
+import logging
+import os
 import requests
+import sqlite3
+import tempfile
+import threading
 import time
+import zlib
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
 from functools import lru_cache
 
+import streamlit as st
+from PIL import Image
+
+# orjson parses PokeAPI's larger responses several times faster; it's optional
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+_LOG = logging.getLogger(__name__)
+
 POKEAPI_BASE = "https://pokeapi.co/api/v2"
 
-# Cache for Pokemon data
-_pokemon_cache = {}
-_types_cache = None
+# On-disk cache of PokeAPI JSON responses, keyed by URL, in a small SQLite table;
+# bump the version to invalidate every entry
+HTTP_CACHE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'pokeapi_cache.db')
+HTTP_CACHE_VERSION = 1
+HTTP_CACHE_TTL = 30 * 86400
+
+# PokeAPI's official sprites - they have both regular and shiny
+SPRITE_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/%d.png"
+SHINY_SPRITE_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/%d.png"
+
+# Sprites that failed to download are served by URL for a while instead of being
+# retried on every rerun; (pokemon_id, shiny) -> time of the failure
+SPRITE_RETRY_AFTER = 300
+_sprite_failures = {}
+
+# Sprite sheets for the Pokedex grid; served by Streamlit's static file serving
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+STATIC_URL = "app/static"
+SPRITE_SIZE = 96
+ATLAS_COLUMNS = 32
+# Sheets that failed to build aren't retried until SPRITE_RETRY_AFTER has passed
+_atlas_failures = {}
+# One lock per (pokemon_ids, shiny) sheet, so two sessions never build the same one
+_atlas_locks = {}
+
+# Worker threads used to download sprites and Pokemon data in parallel; one pool
+# is shared by every caller instead of spinning up threads per batch
+SPRITE_WORKERS = 16
+_EXECUTOR = ThreadPoolExecutor(max_workers=SPRITE_WORKERS, thread_name_prefix="pokeapi")
+
+# Shared HTTP session: keeps TLS connections to PokeAPI and the sprite host alive
+# between calls, with a pool large enough for the sprite download workers, and
+# retries throttled or failed GETs with exponential backoff (honoring Retry-After).
+# Connection and read errors get a single retry so an unreachable host fails fast
+HTTP_POOL_SIZE = 32
+HTTP_RETRY = Retry(
+    total=5,
+    connect=1,
+    read=1,
+    status=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=['GET', 'HEAD'],
+    respect_retry_after_header=True,
+)
+
+# Back off before PokeAPI starts throttling: when a response reports fewer than
+# this many requests left in the rate limit window, pause before the next one
+RATE_LIMIT_FLOOR = 5
+RATE_LIMIT_PAUSE = 1.0
+
+def _respect_rate_limit(response, *args, **kwargs):
+    """Response hook that sleeps when the rate limit budget is nearly spent."""
+    remaining = response.headers.get('X-RateLimit-Remaining', '')
+    if remaining.isdigit() and int(remaining) < RATE_LIMIT_FLOOR:
+        retry_after = response.headers.get('Retry-After', '')
+        time.sleep(float(retry_after) if retry_after.isdigit() else RATE_LIMIT_PAUSE)
+
+_SESSION = requests.Session()
+# requests' default Accept-Encoding already adds br when brotli is installed
+_SESSION.headers['User-Agent'] = 'ZA-shiny-hunter (+https://github.com/LearningEverythingFirstTIme/ZA-shiny-hunter)'
+_SESSION.hooks['response'].append(_respect_rate_limit)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY))
+
+def _http_cache_connect():
+    """Open the on-disk cache, creating its table on first use."""
+    os.makedirs(os.path.dirname(HTTP_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(HTTP_CACHE_PATH, timeout=5)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS http_cache (
+            key TEXT PRIMARY KEY,
+            fetched_at REAL NOT NULL,
+            body BLOB NOT NULL
+        )
+    ''')
+    return conn
+
+# The cache is only an optimization, so any failure in it counts as a miss
+def _http_cache_failed(action, e):
+    """Log a cache failure; a damaged database file is set aside so the next call starts fresh."""
+    _LOG.warning("Error %s HTTP cache: %s", action, e)
+    if isinstance(e, sqlite3.DatabaseError) and not isinstance(e, sqlite3.OperationalError):
+        try:
+            os.replace(HTTP_CACHE_PATH, f"{HTTP_CACHE_PATH}.corrupt")
+        except OSError:
+            pass
+
+def _http_cache_get(key):
+    """Cached JSON for a key if present and fresh, else None."""
+    try:
+        with closing(_http_cache_connect()) as conn:
+            row = conn.execute(
+                'SELECT body FROM http_cache WHERE key = ? AND fetched_at > ?',
+                (key, time.time() - HTTP_CACHE_TTL)
+            ).fetchone()
+    except Exception as e:
+        _http_cache_failed("reading", e)
+        return None
+    if row is None:
+        return None
+    try:
+        return _json.loads(row[0])
+    except ValueError as e:
+        _LOG.warning("Dropping unreadable HTTP cache entry %s: %s", key, e)
+        _http_cache_delete(key)
+        return None
+
+def _http_cache_delete(key):
+    """Remove an entry from the on-disk cache, if it's there."""
+    try:
+        with closing(_http_cache_connect()) as conn, conn:
+            conn.execute('DELETE FROM http_cache WHERE key = ?', (key,))
+    except Exception as e:
+        _http_cache_failed("deleting from", e)
+
+def _http_cache_put(key, data):
+    """Store JSON in the on-disk cache; failures only cost a refetch later."""
+    try:
+        with closing(_http_cache_connect()) as conn, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO http_cache (key, fetched_at, body) VALUES (?, ?, ?)',
+                (key, time.time(), _json.dumps(data))
+            )
+    except Exception as e:
+        _http_cache_failed("writing", e)
+
+def _http_cache_key(url):
+    """On-disk cache key for a URL."""
+    return f"v{HTTP_CACHE_VERSION}:{url}"
+
+def _get_json(url):
+    """GET a PokeAPI URL as JSON, served from the on-disk cache when possible."""
+    key = _http_cache_key(url)
+    data = _http_cache_get(key)
+    if data is None:
+        response = _SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        try:
+            data = _json.loads(response.content)
+        except ValueError as e:
+            raise requests.exceptions.InvalidJSONError(f"Invalid JSON from {url}: {e}", response=response) from e
+        _http_cache_put(key, data)
+    return data
 
 def get_pokemon_sprite(pokemon_id, shiny=False):
-    """Get sprite URL for a Pokemon."""
-    # Use PokeAPI's official sprites - they have both regular and shiny
-    if shiny:
-        return f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/{pokemon_id}.png"
-    return f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/{pokemon_id}.png"
+    """Get sprite URL for a Pokemon; the id may be an int or a numeric string."""
+    return (SHINY_SPRITE_URL if shiny else SPRITE_URL) % int(pokemon_id)
 
-def get_pokemon_data(pokemon_id_or_name):
-    """Get full Pokemon data from PokeAPI."""
+@lru_cache(maxsize=4096)
+def _fetch_sprite_b64(pokemon_id, shiny):
+    """Download a sprite PNG as base64 (failed downloads raise and are not cached)."""
+    response = _SESSION.get(get_pokemon_sprite(pokemon_id, shiny=shiny), timeout=10)
+    response.raise_for_status()
+    return base64.b64encode(response.content).decode('ascii')
+
+def get_sprite_data_uri(pokemon_id, shiny=False):
+    """Get a sprite as an inline data URI, falling back to its URL on error."""
+    key = (pokemon_id, shiny)
+    if time.time() - _sprite_failures.get(key, 0) < SPRITE_RETRY_AFTER:
+        return get_pokemon_sprite(pokemon_id, shiny=shiny)
+    try:
+        return f"data:image/png;base64,{_fetch_sprite_b64(pokemon_id, shiny)}"
+    except requests.exceptions.RequestException as e:
+        _sprite_failures[key] = time.time()
+        _LOG.warning("Error fetching sprite %s: %s", pokemon_id, e)
+        return get_pokemon_sprite(pokemon_id, shiny=shiny)
+
+def prefetch_sprites(pokemon_ids, shiny=False):
+    """Download sprites in parallel; returns {pokemon_id: data URI, or URL if it failed}."""
+    pokemon_ids = list(pokemon_ids)
+    uris = _EXECUTOR.map(lambda pokemon_id: get_sprite_data_uri(pokemon_id, shiny=shiny), pokemon_ids)
+    return dict(zip(pokemon_ids, uris))
+
+@lru_cache(maxsize=8)
+def _atlas_layout(pokemon_ids, shiny):
+    """Sheet filename and {pokemon_id: (x, y)} tile offsets for a set of Pokemon."""
+    positions = {
+        pokemon_id: ((i % ATLAS_COLUMNS) * SPRITE_SIZE, (i // ATLAS_COLUMNS) * SPRITE_SIZE)
+        for i, pokemon_id in enumerate(pokemon_ids)
+    }
+    # Name the sheet after its contents so a changed Pokedex never reuses a stale one
+    digest = zlib.crc32(",".join(map(str, pokemon_ids)).encode())
+    return f"sprites_{'shiny' if shiny else 'normal'}_{digest:08x}.png", positions
+
+def _build_sprite_atlas(pokemon_ids, shiny, filename, positions):
+    """Download the sprites and paste them into one PNG under static/."""
+    uris = prefetch_sprites(pokemon_ids, shiny=shiny)
+    missing = sum(not uri.startswith("data:") for uri in uris.values())
+    if missing:
+        raise requests.exceptions.RequestException(f"{missing} sprites could not be downloaded")
+    rows = (len(pokemon_ids) + ATLAS_COLUMNS - 1) // ATLAS_COLUMNS
+    atlas = Image.new('RGBA', (ATLAS_COLUMNS * SPRITE_SIZE, max(rows, 1) * SPRITE_SIZE))
+    for pokemon_id, offset in positions.items():
+        png = base64.b64decode(_fetch_sprite_b64(pokemon_id, shiny))
+        with Image.open(io.BytesIO(png)) as sprite:
+            atlas.paste(sprite.convert('RGBA').resize((SPRITE_SIZE, SPRITE_SIZE)), offset)
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    # A unique temp file per writer, so concurrent builds never clobber each other
+    with tempfile.NamedTemporaryFile(dir=STATIC_DIR, prefix=f"{filename}.", suffix='.tmp', delete=False) as tmp:
+        atlas.save(tmp, format='PNG', optimize=True)
+    os.replace(tmp.name, os.path.join(STATIC_DIR, filename))
+
+def get_sprite_atlas(pokemon_ids, shiny=False):
+    """Get a sprite sheet for the given Pokemon as (url, {pokemon_id: (x, y)}), or None on error."""
+    key = (tuple(pokemon_ids), shiny)
+    filename, positions = _atlas_layout(*key)
+    path = os.path.join(STATIC_DIR, filename)
+    if os.path.exists(path):
+        return f"{STATIC_URL}/{filename}", positions
+    if time.time() - _atlas_failures.get(key, 0) < SPRITE_RETRY_AFTER:
+        return None
+    try:
+        # Only sessions waiting on this same sheet queue up behind its build
+        with _atlas_locks.setdefault(key, threading.Lock()):
+            if not os.path.exists(path):
+                _build_sprite_atlas(*key, filename, positions)
+    except (requests.exceptions.RequestException, OSError) as e:
+        _atlas_failures[key] = time.time()
+        _LOG.warning("Error building sprite sheet: %s", e)
+        return None
+    return f"{STATIC_URL}/{filename}", positions
+
+@lru_cache(maxsize=2048)
+def _cap(name):
+    """Display form of a PokeAPI name; names repeat across lists, so it's memoized."""
+    return name.capitalize()
+
+@lru_cache(maxsize=512)
+def _ability_label(name):
+    """Display form of a PokeAPI ability name, e.g. 'swift-swim' -> 'Swift Swim'."""
+    return name.replace('-', ' ').title()
+
+@lru_cache(maxsize=4096)
+def _resolve_pokemon_name(name):
+    """National dex id for a PokeAPI name (failed lookups raise and are not cached)."""
+    data = _get_json(f"{POKEAPI_BASE}/pokemon/{name}")
+    # Store the response under its id URL too, so the fetch by id is a disk hit
+    _http_cache_put(_http_cache_key(f"{POKEAPI_BASE}/pokemon/{data['id']}"), data)
+    return data['id']
+
+def _normalize_key(pokemon_id_or_name):
+    """Canonical cache key for a Pokemon id or name: always the id, as a string."""
     if isinstance(pokemon_id_or_name, int) or pokemon_id_or_name.isdigit():
-        cache_key = int(pokemon_id_or_name)
-    else:
-        cache_key = pokemon_id_or_name.lower()
-    
-    if cache_key in _pokemon_cache:
-        return _pokemon_cache[cache_key]
+        return str(int(pokemon_id_or_name))
+    name = pokemon_id_or_name.lower()
+    # Z-A names resolve from the static map; others are looked up once and remembered
+    if name in ZA_ID_MAP:
+        return str(ZA_ID_MAP[name])
+    return str(_resolve_pokemon_name(name))
+
+@lru_cache(maxsize=4096)
+def _fetch_pokemon_data(key):
+    """Fetch and simplify a Pokemon from PokeAPI (failed requests raise and are not cached)."""
+    data = _get_json(f"{POKEAPI_BASE}/pokemon/{key}")
     
+    return {
+        'id': data['id'],
+        'name': _cap(data['name']),
+        'types': [_cap(t['type']['name']) for t in data['types']],
+        'sprite': data['sprites']['front_default'],
+        'shiny_sprite': data['sprites']['front_shiny'],
+        'height': data['height'] / 10,  # Convert to meters
+        'weight': data['weight'] / 10,  # Convert to kg
+        'abilities': [_ability_label(a['ability']['name']) for a in data['abilities']],
+    }
+
+def get_pokemon_data(pokemon_id_or_name):
+    """Get full Pokemon data from PokeAPI."""
     try:
-        response = requests.get(f"{POKEAPI_BASE}/pokemon/{pokemon_id_or_name}", timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Simplify and cache
-        simplified = {
-            'id': data['id'],
-            'name': data['name'].capitalize(),
-            'types': [t['type']['name'].capitalize() for t in data['types']],
-            'sprite': data['sprites']['front_default'],
-            'shiny_sprite': data['sprites']['front_shiny'],
-            'height': data['height'] / 10,  # Convert to meters
-            'weight': data['weight'] / 10,  # Convert to kg
-            'abilities': [a['ability']['name'].replace('-', ' ').title() for a in data['abilities']],
-        }
-        
-        _pokemon_cache[cache_key] = simplified
-        _pokemon_cache[data['id']] = simplified
-        
-        return simplified
+        return _fetch_pokemon_data(_normalize_key(pokemon_id_or_name))
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching Pokemon {pokemon_id_or_name}: {e}")
+        _LOG.warning("Error fetching Pokemon %s: %s", pokemon_id_or_name, e)
         return None
 
+def get_pokemon_data_many(pokemon_ids_or_names):
+    """Get full data for several Pokemon in parallel, in input order (None for failures)."""
+    return list(_EXECUTOR.map(get_pokemon_data, pokemon_ids_or_names))
+
+# Awaitable versions for event-loop callers, so a lookup doesn't block the loop
+async def a_get_pokemon_data(pokemon_id_or_name):
+    """Async get_pokemon_data(), run in a worker thread."""
+    return await asyncio.to_thread(get_pokemon_data, pokemon_id_or_name)
+
+async def a_get_pokemon_data_many(pokemon_ids_or_names):
+    """Async get_pokemon_data_many(), run in a worker thread."""
+    return await asyncio.to_thread(get_pokemon_data_many, pokemon_ids_or_names)
+
 # Z-A Pokedex - Pokemon available in Pokemon Legends: Z-A
 # Source: pokemondb.net/pokedex/game/legends-z-a (~230 Pokemon)
-ZA_POKEDEX = {
-    'chikorita', 'bayleef', 'meganium', 'tepig', 'pignite', 'emboar', 'totodile', 'croconaw', 'feraligatr',
-    'fletchling', 'fletchinder', 'talonflame', 'bunnelby', 'diggersby', 'scatterbug', 'spewpa', 'vivillon',
-    'weedle', 'kakuna', 'beedrill', 'pidgey', 'pidgeotto', 'pidgeot', 'mareep', 'flaaffy', 'ampharos',
-    'patrat', 'watchog', 'budew', 'roselia', 'roserade', 'magikarp', 'gyarados', 'binacle', 'barbaracle',
-    'staryu', 'starmie', 'flabebe', 'floette', 'florges', 'skiddo', 'gogoat', 'espurr', 'meowstic',
-    'litleo', 'pyroar', 'pancham', 'pangoro', 'trubbish', 'garbodor', 'dedenne', 'pichu', 'pikachu', 'raichu',
-    'cleffa', 'clefairy', 'clefable', 'spinarak', 'ariados', 'ekans', 'arbok', 'abra', 'kadabra', 'alakazam',
-    'gastly', 'haunter', 'gengar', 'venipede', 'whirlipede', 'scolipede', 'honedge', 'doublade', 'aegislash',
-    'bellsprout', 'weepinbell', 'victreebel', 'pansage', 'simisage', 'pansear', 'simisear', 'panpour', 'simipour',
-    'meditite', 'medicham', 'electrike', 'manectric', 'ralts', 'kirlia', 'gardevoir', 'gallade', 'houndour',
-    'houndoom', 'swablu', 'altaria', 'audino', 'spritzee', 'aromatisse', 'swirlix', 'slurpuff', 'eevee',
-    'vaporeon', 'jolteon', 'flareon', 'espeon', 'umbreon', 'leafeon', 'glaceon', 'sylveon', 'buneary', 'lopunny',
-    'shuppet', 'banette', 'vanillite', 'vanillish', 'vanilluxe', 'numel', 'camerupt', 'hippopotas', 'hippowdon',
-    'drilbur', 'excadrill', 'sandile', 'krokorok', 'krookodile', 'machop', 'machoke', 'machamp', 'gible',
-    'gabite', 'garchomp', 'carbink', 'sableye', 'mawile', 'absol', 'riolu', 'lucario', 'slowpoke', 'slowbro',
-    'slowking', 'carvanha', 'sharpedo', 'tynamo', 'eelektrik', 'eelektross', 'dratini', 'dragonair', 'dragonite',
-    'bulbasaur', 'ivysaur', 'venusaur', 'charmander', 'charmeleon', 'charizard', 'squirtle', 'wartortle', 'blastoise',
-    'stunfisk', 'furfrou', 'klefki', 'deoxys', 'heatran', 'regigigas', 'giratina', 'cresselia',
-    'tornadus', 'thundurus', 'landorus', 'kyurem', 'keldeo', 'meloetta', 'genesect', 'hoopa', 'volcanion',
-    'diancie', 'zygarde', 'type: null', 'charjabug', 'rivals', 'hakamo-o', 'kommo-o', 'torobot', 'cosmog',
-    'nihilego', 'buzzwole', 'pheromosa', 'xurkitree', 'celesteela', 'kartana', 'guzzlord', 'necrozma',
-    'magearna', 'marshadow', 'poipole', 'naganadel', 'stakataka', 'blacephalon', 'zeraora', 'meltan',
-    'meloetta', 'meowstic', 'aegislash', 'pumpkaboo', 'gourgeist', 'xerneas', 'yveltal', 'zygarde',
-    'ho-oh', 'lugia', 'calk', 'cobalion', 'terrakion', 'virizion', 'tornadus', 'thundurus', 'landorus',
-    'reshiram', 'zekrom', 'kyurem', 'latios', 'latias', 'jirachi', 'deoxys', 'wormadam', 'mothim', 'vespiquen',
-    'kricketot', 'kricketune', 'shinx', 'luxio', 'luxray', 'combee', 'vespiquen', 'pachirisu', 'buizel', 'floatzel',
-    'cherubi', 'cherrim', 'shellos', 'gastrodon', 'drifloon', 'drifblim', 'buneary', 'lopunny', 'glameow',
-    'purugly', 'stunky', 'skuntank', 'bronzor', 'bronzong', 'gible', 'gabite', 'garchomp', 'riolu', 'lucario',
-    'hippopotas', 'hippowdon', 'skorupi', 'drapion', 'croagunk', 'toxicroak', 'carnivine', 'finneon', 'lumineon',
-    'snover', 'abomasnow', 'weavile', 'magnezone', 'leafeon', 'glaceon', 'glalie', 'froslass', 'rotom',
-    'uxie', 'mesprit', 'azelf', 'dialga', 'palkia', 'giratina', 'cresselia', 'phione', 'manaphy', 'darkrai',
-    'shaymin', 'arceus', 'victini', 'snivy', 'servine', 'serperior', 'tepig', 'pignite', 'emboar', 'oshawott',
-    'dewott', 'samurott', 'patrat', 'watchog', 'lillipup', 'herdier', 'stoutland', 'purrloin', 'liepard',
-    'pansage', 'simisage', 'pansear', 'simisear', 'panpour', 'simipour', 'munna', 'musharna', 'pidove',
-    'tranquill', 'unfezant', 'blitzle', 'zebstrika', 'roggenrola', 'boldore', 'gigalith', 'woobat', 'swoobat',
-    'drilbur', 'excadrill', 'audino', 'timburr', 'gurdurr', 'conkeldurr', 'tympole', 'palpitoad', 'seismitoad',
-    'throh', 'sawk', 'sewaddle', 'swadloon', 'leavanny', 'venipede', 'whirlipede', 'scolipede', 'cottonee',
-    'whimsicott', 'petilil', 'lilligant', 'basculin', 'sandile', 'krokorok', 'krookodile', 'darumaka',
-    'darmanitan', 'maractus', 'dwebble', 'crustle', 'scraggy', 'scrafty', 'sigilyph', 'yamask', 'cofagrigus',
-    'tirtouga', 'carracosta', 'archen', 'archeops', 'trubbish', 'garbodor', 'zorua', 'zoroark', 'minccino',
-    'cinccino', 'gothita', 'gothorita', 'gothitelle', 'solosis', 'duosion', 'reuniclus', 'ducklett', 'swanna',
-    'vanillite', 'vanillish', 'vanilluxe', 'deerling', 'sawsbuck', 'emolga', 'karrablast', 'escavalier',
-    'foongus', 'amoonguss', 'frillish', 'jellicent', 'alomomola', 'joltik', 'galvantula', 'ferroseed',
-    'ferrothorn', 'klink', 'klang', 'klinklang', 'tynamo', 'eelektrik', 'eelektross', 'elgyem', 'beheeyem',
-    'litwick', 'lampent', 'chandelure', 'axew', 'fraxure', 'haxorus', 'cubchoo', 'beartic', 'cryogonal',
-    'shelmet', 'accelgor', 'stunfisk', 'mienfoo', 'mienshao', 'druddigon', 'golett', 'golurk', 'pawniard',
-    'bisharp', 'bouffalant', 'rufflet', 'braviary', 'vullaby', 'mandibuzz', 'heatmor', 'durant', 'deino',
-    'zweilous', 'hydreigon', 'larvesta', 'volcarona', 'cobalion', 'terrakion', 'virizion', 'tornadus',
-    'thundurus', 'landorus', 'zekrom', 'reshiram', 'kyurem', 'latios', 'latias', 'xerneas', 'yveltal',
-    'zygarde', 'diancie', 'hoopa', 'volcanion', 'cosmog', 'nihilego', 'buzzwole', 'pheromosa', 'xurkitree',
-    'kartana', 'guzzlord', 'necrozma', 'magearna', 'marshadow', 'poipole', 'naganadel', 'stakataka',
-    'blacephalon', 'zeraora', 'meltan', 'melmetal',
-    # Add a few common ones that might be missed
-    'celebi', 'jirachi', 'shaymin', 'arceus'
+# PokeAPI name -> national dex id, in dex order, so the list needs no network call
+ZA_ID_MAP = {
+    'bulbasaur': 1, 'ivysaur': 2, 'venusaur': 3, 'charmander': 4, 'charmeleon': 5, 'charizard': 6,
+    'squirtle': 7, 'wartortle': 8, 'blastoise': 9, 'weedle': 13, 'kakuna': 14, 'beedrill': 15, 'pidgey': 16,
+    'pidgeotto': 17, 'pidgeot': 18, 'ekans': 23, 'arbok': 24, 'pikachu': 25, 'raichu': 26, 'clefairy': 35,
+    'clefable': 36, 'abra': 63, 'kadabra': 64, 'alakazam': 65, 'machop': 66, 'machoke': 67, 'machamp': 68,
+    'bellsprout': 69, 'weepinbell': 70, 'victreebel': 71, 'slowpoke': 79, 'slowbro': 80, 'gastly': 92,
+    'haunter': 93, 'gengar': 94, 'staryu': 120, 'starmie': 121, 'magikarp': 129, 'gyarados': 130, 'eevee': 133,
+    'vaporeon': 134, 'jolteon': 135, 'flareon': 136, 'dratini': 147, 'dragonair': 148, 'dragonite': 149,
+    'chikorita': 152, 'bayleef': 153, 'meganium': 154, 'totodile': 158, 'croconaw': 159, 'feraligatr': 160,
+    'spinarak': 167, 'ariados': 168, 'pichu': 172, 'cleffa': 173, 'mareep': 179, 'flaaffy': 180,
+    'ampharos': 181, 'espeon': 196, 'umbreon': 197, 'slowking': 199, 'houndour': 228, 'houndoom': 229,
+    'lugia': 249, 'ho-oh': 250, 'celebi': 251, 'ralts': 280, 'kirlia': 281, 'gardevoir': 282, 'sableye': 302,
+    'mawile': 303, 'meditite': 307, 'medicham': 308, 'electrike': 309, 'manectric': 310, 'roselia': 315,
+    'carvanha': 318, 'sharpedo': 319, 'numel': 322, 'camerupt': 323, 'swablu': 333, 'altaria': 334,
+    'shuppet': 353, 'banette': 354, 'absol': 359, 'glalie': 362, 'latias': 380, 'latios': 381, 'jirachi': 385,
+    'deoxys': 386, 'kricketot': 401, 'kricketune': 402, 'shinx': 403, 'luxio': 404, 'luxray': 405, 'budew': 406,
+    'roserade': 407, 'wormadam': 413, 'mothim': 414, 'combee': 415, 'vespiquen': 416, 'pachirisu': 417,
+    'buizel': 418, 'floatzel': 419, 'cherubi': 420, 'cherrim': 421, 'shellos': 422, 'gastrodon': 423,
+    'drifloon': 425, 'drifblim': 426, 'buneary': 427, 'lopunny': 428, 'glameow': 431, 'purugly': 432,
+    'stunky': 434, 'skuntank': 435, 'bronzor': 436, 'bronzong': 437, 'gible': 443, 'gabite': 444,
+    'garchomp': 445, 'riolu': 447, 'lucario': 448, 'hippopotas': 449, 'hippowdon': 450, 'skorupi': 451,
+    'drapion': 452, 'croagunk': 453, 'toxicroak': 454, 'carnivine': 455, 'finneon': 456, 'lumineon': 457,
+    'snover': 459, 'abomasnow': 460, 'weavile': 461, 'magnezone': 462, 'leafeon': 470, 'glaceon': 471,
+    'gallade': 475, 'froslass': 478, 'rotom': 479, 'uxie': 480, 'mesprit': 481, 'azelf': 482, 'dialga': 483,
+    'palkia': 484, 'heatran': 485, 'regigigas': 486, 'giratina': 487, 'cresselia': 488, 'phione': 489,
+    'manaphy': 490, 'darkrai': 491, 'shaymin': 492, 'arceus': 493, 'victini': 494, 'snivy': 495, 'servine': 496,
+    'serperior': 497, 'tepig': 498, 'pignite': 499, 'emboar': 500, 'oshawott': 501, 'dewott': 502,
+    'samurott': 503, 'patrat': 504, 'watchog': 505, 'lillipup': 506, 'herdier': 507, 'stoutland': 508,
+    'purrloin': 509, 'liepard': 510, 'pansage': 511, 'simisage': 512, 'pansear': 513, 'simisear': 514,
+    'panpour': 515, 'simipour': 516, 'munna': 517, 'musharna': 518, 'pidove': 519, 'tranquill': 520,
+    'unfezant': 521, 'blitzle': 522, 'zebstrika': 523, 'roggenrola': 524, 'boldore': 525, 'gigalith': 526,
+    'woobat': 527, 'swoobat': 528, 'drilbur': 529, 'excadrill': 530, 'audino': 531, 'timburr': 532,
+    'gurdurr': 533, 'conkeldurr': 534, 'tympole': 535, 'palpitoad': 536, 'seismitoad': 537, 'throh': 538,
+    'sawk': 539, 'sewaddle': 540, 'swadloon': 541, 'leavanny': 542, 'venipede': 543, 'whirlipede': 544,
+    'scolipede': 545, 'cottonee': 546, 'whimsicott': 547, 'petilil': 548, 'lilligant': 549, 'basculin': 550,
+    'sandile': 551, 'krokorok': 552, 'krookodile': 553, 'darumaka': 554, 'darmanitan': 555, 'maractus': 556,
+    'dwebble': 557, 'crustle': 558, 'scraggy': 559, 'scrafty': 560, 'sigilyph': 561, 'yamask': 562,
+    'cofagrigus': 563, 'tirtouga': 564, 'carracosta': 565, 'archen': 566, 'archeops': 567, 'trubbish': 568,
+    'garbodor': 569, 'zorua': 570, 'zoroark': 571, 'minccino': 572, 'cinccino': 573, 'gothita': 574,
+    'gothorita': 575, 'gothitelle': 576, 'solosis': 577, 'duosion': 578, 'reuniclus': 579, 'ducklett': 580,
+    'swanna': 581, 'vanillite': 582, 'vanillish': 583, 'vanilluxe': 584, 'deerling': 585, 'sawsbuck': 586,
+    'emolga': 587, 'karrablast': 588, 'escavalier': 589, 'foongus': 590, 'amoonguss': 591, 'frillish': 592,
+    'jellicent': 593, 'alomomola': 594, 'joltik': 595, 'galvantula': 596, 'ferroseed': 597, 'ferrothorn': 598,
+    'klink': 599, 'klang': 600, 'klinklang': 601, 'tynamo': 602, 'eelektrik': 603, 'eelektross': 604,
+    'elgyem': 605, 'beheeyem': 606, 'litwick': 607, 'lampent': 608, 'chandelure': 609, 'axew': 610,
+    'fraxure': 611, 'haxorus': 612, 'cubchoo': 613, 'beartic': 614, 'cryogonal': 615, 'shelmet': 616,
+    'accelgor': 617, 'stunfisk': 618, 'mienfoo': 619, 'mienshao': 620, 'druddigon': 621, 'golett': 622,
+    'golurk': 623, 'pawniard': 624, 'bisharp': 625, 'bouffalant': 626, 'rufflet': 627, 'braviary': 628,
+    'vullaby': 629, 'mandibuzz': 630, 'heatmor': 631, 'durant': 632, 'deino': 633, 'zweilous': 634,
+    'hydreigon': 635, 'larvesta': 636, 'volcarona': 637, 'cobalion': 638, 'terrakion': 639, 'virizion': 640,
+    'tornadus': 641, 'thundurus': 642, 'reshiram': 643, 'zekrom': 644, 'landorus': 645, 'kyurem': 646,
+    'keldeo': 647, 'meloetta': 648, 'genesect': 649, 'bunnelby': 659, 'diggersby': 660, 'fletchling': 661,
+    'fletchinder': 662, 'talonflame': 663, 'scatterbug': 664, 'spewpa': 665, 'vivillon': 666, 'litleo': 667,
+    'pyroar': 668, 'flabebe': 669, 'floette': 670, 'florges': 671, 'skiddo': 672, 'gogoat': 673, 'pancham': 674,
+    'pangoro': 675, 'furfrou': 676, 'espurr': 677, 'meowstic': 678, 'honedge': 679, 'doublade': 680,
+    'aegislash': 681, 'spritzee': 682, 'aromatisse': 683, 'swirlix': 684, 'slurpuff': 685, 'binacle': 688,
+    'barbaracle': 689, 'sylveon': 700, 'dedenne': 702, 'carbink': 703, 'klefki': 707, 'pumpkaboo': 710,
+    'gourgeist': 711, 'xerneas': 716, 'yveltal': 717, 'zygarde': 718, 'diancie': 719, 'hoopa': 720,
+    'volcanion': 721, 'charjabug': 737, 'type-null': 772, 'hakamo-o': 783, 'kommo-o': 784, 'cosmog': 789,
+    'nihilego': 793, 'buzzwole': 794, 'pheromosa': 795, 'xurkitree': 796, 'celesteela': 797, 'kartana': 798,
+    'guzzlord': 799, 'necrozma': 800, 'magearna': 801, 'marshadow': 802, 'poipole': 803, 'naganadel': 804,
+    'stakataka': 805, 'blacephalon': 806, 'zeraora': 807, 'meltan': 808, 'melmetal': 809,
 }
+ZA_POKEDEX = frozenset(ZA_ID_MAP)
 
-def get_za_pokemon():
-    """Get list of Pokemon available in Pokemon Legends: Z-A."""
-    try:
-        response = requests.get(f"{POKEAPI_BASE}/pokemon?limit=1025", timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        pokemon_list = []
-        for p in data['results']:
-            url_parts = p['url'].rstrip('/').split('/')
-            poke_id = int(url_parts[-1])
-            poke_name = p['name'].lower()
-            
-            # Only include Pokemon in Z-A pokedex
-            if poke_name in ZA_POKEDEX or poke_id <= 230:
-                pokemon_list.append({
-                    'id': poke_id,
-                    'name': p['name'].capitalize(),
-                    'sprite': get_pokemon_sprite(poke_id, shiny=False),
-                    'shiny_sprite': get_pokemon_sprite(poke_id, shiny=True),
-                })
-        
-        return pokemon_list
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching Z-A Pokemon list: {e}")
-        return []
+# PokeAPI Pokemon URLs look like {POKEMON_URL_PREFIX}{id}/, so the id is a slice
+POKEMON_URL_PREFIX = f"{POKEAPI_BASE}/pokemon/"
+_POKEMON_URL_PREFIX_LEN = len(POKEMON_URL_PREFIX)
+
+def _url_id(url):
+    """Pokemon id from a PokeAPI resource URL."""
+    if url.startswith(POKEMON_URL_PREFIX):
+        return int(url[_POKEMON_URL_PREFIX_LEN:].rstrip('/'))
+    return int(url.rstrip('/').rsplit('/', 1)[-1])
+
+@dataclass(slots=True, frozen=True)
+class PokemonRow:
+    """List entry for a Pokemon: id, display name and sprite URLs."""
+    id: int
+    name: str
+    sprite: str
+    shiny_sprite: str
+
+def _pokemon_row(poke_name, poke_id):
+    """Build the PokemonRow for a PokeAPI name and id."""
+    return PokemonRow(poke_id, _cap(poke_name), SPRITE_URL % poke_id, SHINY_SPRITE_URL % poke_id)
+
+def _prefetch_row_sprites(pokemon_list):
+    """Warm the sprite cache with the regular and shiny sprites of a Pokemon list."""
+    pokemon_ids = [p.id for p in pokemon_list]
+    prefetch_sprites(pokemon_ids, shiny=False)
+    prefetch_sprites(pokemon_ids, shiny=True)
+
+@lru_cache(maxsize=1)
+def _za_pokemon_rows():
+    """The Z-A Pokedex as PokemonRows, built once per process (a tuple, so callers can't mutate it)."""
+    return tuple(_pokemon_row(poke_name, poke_id) for poke_name, poke_id in ZA_ID_MAP.items())
+
+def get_za_pokemon(prefetch=False):
+    """Get list of Pokemon available in Pokemon Legends: Z-A, optionally downloading their sprites."""
+    pokemon_list = _za_pokemon_rows()
+    if prefetch:
+        _prefetch_row_sprites(pokemon_list)
+    return pokemon_list
 
 # Legacy function - now returns Z-A Pokemon only
 def get_all_pokemon():
     """Get list of Pokemon available in Pokemon Legends: Z-A."""
     return get_za_pokemon()
 
-def get_pokemon_by_type(pokemon_type):
-    """Get all Pokemon of a specific type."""
+@st.cache_data(ttl=86400, show_spinner=False)
+def _fetch_pokemon_by_type(pokemon_type):
+    """Fetch all Pokemon of a type from PokeAPI (cached for a day, errors are not cached)."""
+    data = _get_json(f"{POKEAPI_BASE}/type/{pokemon_type}")
+    
+    return [_pokemon_row(p['pokemon']['name'], _url_id(p['pokemon']['url'])) for p in data['pokemon']]
+
+def get_pokemon_by_type(pokemon_type, prefetch=False):
+    """Get all Pokemon of a specific type, optionally downloading their sprites."""
     try:
-        response = requests.get(f"{POKEAPI_BASE}/type/{pokemon_type.lower()}", timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        pokemon_list = []
-        for p in data['pokemon']:
-            url_parts = p['pokemon']['url'].rstrip('/').split('/')
-            poke_id = int(url_parts[-1])
-            
-            pokemon_list.append({
-                'id': poke_id,
-                'name': p['pokemon']['name'].capitalize(),
-                'sprite': get_pokemon_sprite(poke_id),
-                'shiny_sprite': get_pokemon_sprite(poke_id, shiny=True),
-            })
-        
-        return pokemon_list
+        pokemon_list = _fetch_pokemon_by_type(pokemon_type.lower())
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching Pokemon by type: {e}")
+        _LOG.warning("Error fetching Pokemon by type: %s", e)
         return []
+    if prefetch:
+        _prefetch_row_sprites(pokemon_list)
+    return pokemon_list
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _fetch_types():
+    """Fetch all Pokemon types from PokeAPI (cached for a day, errors are not cached)."""
+    data = _get_json(f"{POKEAPI_BASE}/type")
+    
+    return [_cap(t['name']) for t in data['results']]
 
 def get_types():
     """Get all Pokemon types."""
-    global _types_cache
-    
-    if _types_cache is not None:
-        return _types_cache
-    
     try:
-        response = requests.get(f"{POKEAPI_BASE}/type", timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        _types_cache = [t['name'].capitalize() for t in data['results']]
-        return _types_cache
+        return _fetch_types()
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching types: {e}")
+        _LOG.warning("Error fetching types: %s", e)
         return []
 
 # Hunt method recommendations based on game and Pokemon
@@ -204,13 +483,4 @@ def get_recommended_method(pokemon_name, game='PLA'):
         'Z-A': ['respawn', 'fast_travel', 'door_method', 'special_scan', 'soft_reboot'],
     }
     
-    return recommendations.get(game, HUNT_METHODS)
-
-if __name__ == '__main__':
-    # Test
-    print("Testing PokeAPI...")
-    all_pokemon = get_all_pokemon()
-    print(f"Fetched {len(all_pokemon)} Pokemon")
-    
-    if all_pokemon:
-        print(f"First Pokemon: {all_pokemon[0]}")
\ No newline at end of file
+    return recommendations.get(game, HUNT_METHODS)
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""Smoke test for the PokeAPI helpers: python tools/smoke_test.py"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pokeapi import get_all_pokemon, get_pokemon_data
+
+if __name__ == '__main__':
+    # Test
+    print("Testing PokeAPI...")
+    all_pokemon = get_all_pokemon()
+    print(f"Fetched {len(all_pokemon)} Pokemon")
+    
+    if all_pokemon:
+        print(f"First Pokemon: {all_pokemon[0]}")
+        print(f"Details: {get_pokemon_data(all_pokemon[0].id)}")